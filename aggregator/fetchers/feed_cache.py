@@ -0,0 +1,196 @@
+"""
+Conditional-GET cache for RSS / Atom feeds.
+
+Remembers the ``ETag`` and ``Last-Modified`` validators of every feed it
+downloads, together with the parsed entries. Later requests send
+``If-None-Match`` / ``If-Modified-Since``; when the server answers
+``304 Not Modified`` the previously parsed entries are returned without
+downloading or re-parsing the body.
+
+Usage::
+
+    from aggregator.fetchers.feed_cache import fetch_feed_entries
+
+    entries = fetch_feed_entries("https://openai.com/news/rss.xml")
+
+    # or, inside a coroutine:
+    entries = await fetch_feed_entries_async(url, client)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import pickle
+import threading
+from pathlib import Path
+from typing import Any
+
+import fastfeedparser as feedparser
+import httpx
+
+from aggregator.fetchers.http_client import CLIENT
+
+logger = logging.getLogger(__name__)
+
+_CACHE_DIR = Path.home() / ".cache" / "ai-news"
+_META_PATH = _CACHE_DIR / "feeds.json"
+_ENTRIES_DIR = _CACHE_DIR / "feeds"
+
+# The runner fetches sources concurrently; serialise access to the cache files.
+_LOCK = threading.Lock()
+
+
+# ---------------------------------------------------------------------------
+# Cache storage
+# ---------------------------------------------------------------------------
+
+def _load_meta() -> dict[str, dict[str, str]]:
+    """Return the per-URL validator map, or an empty dict if unavailable."""
+    try:
+        return json.loads(_META_PATH.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as exc:
+        logger.warning("Ignoring unreadable feed cache '%s': %s", _META_PATH, exc)
+        return {}
+
+
+def _save_meta(meta: dict[str, dict[str, str]]) -> None:
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _META_PATH.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+    except OSError as exc:
+        logger.warning("Could not write feed cache '%s': %s", _META_PATH, exc)
+
+
+def _entries_path(url: str) -> Path:
+    return _ENTRIES_DIR / f"{hashlib.sha256(url.encode()).hexdigest()}.pickle"
+
+
+def _load_entries(url: str) -> list[Any] | None:
+    """Return the previously parsed entries for *url*, or ``None``."""
+    try:
+        with _entries_path(url).open("rb") as fh:
+            return pickle.load(fh)
+    except FileNotFoundError:
+        return None
+    except Exception as exc:
+        logger.warning("Ignoring unreadable cached entries for '%s': %s", url, exc)
+        return None
+
+
+def _save_entries(url: str, entries: list[Any]) -> None:
+    try:
+        _ENTRIES_DIR.mkdir(parents=True, exist_ok=True)
+        with _entries_path(url).open("wb") as fh:
+            pickle.dump(entries, fh)
+    except Exception as exc:
+        logger.warning("Could not cache entries for '%s': %s", url, exc)
+
+
+# ---------------------------------------------------------------------------
+# Conditional GET
+# ---------------------------------------------------------------------------
+
+def _prepare_request(url: str) -> tuple[dict[str, str], list[Any] | None]:
+    """
+    Return the conditional-GET headers for *url* and its cached entries.
+
+    Validators are only sent when parsed entries for *url* are cached, so
+    a ``304`` response can always be served from disk.
+    """
+    with _LOCK:
+        validators = _load_meta().get(url, {})
+        cached_entries = _load_entries(url) if validators else None
+
+    headers: dict[str, str] = {}
+    if cached_entries is not None:
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+    return headers, cached_entries
+
+
+def _handle_response(
+    url: str,
+    response: httpx.Response,
+    cached_entries: list[Any] | None,
+) -> list[Any]:
+    """Parse *response* (or reuse *cached_entries* on 304) and update the cache."""
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+
+    if response.status_code == 304 and cached_entries is not None:
+        logger.debug("Feed not modified, using cached entries: %s", url)
+        # A 304 may carry refreshed validators; keep them like feedparser's
+        # feed.etag / feed.modified so the next request sends the latest.
+        if etag or last_modified:
+            with _LOCK:
+                meta = _load_meta()
+                previous = meta.get(url, {})
+                updated = {
+                    "etag": etag or previous.get("etag", ""),
+                    "last_modified": last_modified or previous.get("last_modified", ""),
+                }
+                if updated != previous:
+                    meta[url] = updated
+                    _save_meta(meta)
+        return cached_entries
+
+    response.raise_for_status()
+    entries = list(feedparser.parse(response.content).entries)
+
+    with _LOCK:
+        meta = _load_meta()
+        if etag or last_modified:
+            meta[url] = {"etag": etag or "", "last_modified": last_modified or ""}
+            _save_entries(url, entries)
+        else:
+            meta.pop(url, None)
+        _save_meta(meta)
+
+    return entries
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def fetch_feed_entries(url: str) -> list[Any]:
+    """
+    Download and parse the feed at *url*, reusing cached entries on 304.
+
+    Args:
+        url: The RSS / Atom feed URL.
+
+    Returns:
+        The feed's entries as returned by fastfeedparser.
+
+    Raises:
+        httpx.HTTPError: If the feed cannot be downloaded.
+        ValueError:      If the response body cannot be parsed as a feed.
+    """
+    headers, cached_entries = _prepare_request(url)
+    response = CLIENT.get(url, headers=headers)
+    return _handle_response(url, response, cached_entries)
+
+
+async def fetch_feed_entries_async(url: str, client: httpx.AsyncClient) -> list[Any]:
+    """
+    Async variant of :func:`fetch_feed_entries` using a caller-owned client.
+
+    Cache reads/writes and feed parsing run in a worker thread so they
+    don't block the event loop while other downloads are in flight.
+
+    Raises:
+        httpx.HTTPError: If the feed cannot be downloaded.
+        ValueError:      If the response body cannot be parsed as a feed.
+    """
+    headers, cached_entries = await asyncio.to_thread(_prepare_request, url)
+    response = await client.get(url, headers=headers)
+    return await asyncio.to_thread(_handle_response, url, response, cached_entries)
@@ -15,18 +15,27 @@ Usage::
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
+from bisect import bisect_left
+from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
-from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from typing import Optional
 
-import feedparser
+import fastfeedparser as feedparser
+import httpx
 from bs4 import BeautifulSoup
-from pydantic import BaseModel
+
+from aggregator.fetchers.feed_cache import fetch_feed_entries, fetch_feed_entries_async
 
 logger = logging.getLogger(__name__)
 
+# Whitespace normalisers used by _strip_html, compiled once at import.
+_WS_RE = re.compile(r"[ \t]+")
+_NL_RE = re.compile(r"\n{3,}")
+
 _FEED_URL = "https://openai.com/news/rss.xml"
 
 
@@ -34,7 +43,8 @@ _FEED_URL = "https://openai.com/news/rss.xml"
 # Data model
 # ---------------------------------------------------------------------------
 
-class OpenAINewsEntry(BaseModel):
+@dataclass(slots=True)
+class OpenAINewsEntry:
     """A single post from the OpenAI News RSS feed."""
 
     post_id: str          # The post URL used as a stable identifier.
@@ -50,77 +60,100 @@ class OpenAINewsEntry(BaseModel):
 
 def _strip_html(raw: str) -> str:
     """Remove HTML tags and normalise whitespace for LLM consumption."""
-    text = BeautifulSoup(raw, "html.parser").get_text(separator=" ")
-    text = re.sub(r"[ \t]+", " ", text)
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    # Most summaries are plain-text teasers; skip the parser when there is
+    # no markup or entity to decode.
+    if "<" not in raw and "&" not in raw:
+        text = raw
+    else:
+        text = BeautifulSoup(raw, "lxml").get_text(separator=" ")
+    text = _WS_RE.sub(" ", text)
+    text = _NL_RE.sub("\n\n", text)
     return text.strip()
 
 
-def _parse_pubdate(item: feedparser.FeedParserDict) -> datetime:
+@lru_cache(maxsize=2048)
+def _parse_iso_utc(raw: str) -> datetime:
     """
-    Return a timezone-aware UTC datetime for a feed item.
+    Parse an ISO 8601 timestamp into a timezone-aware UTC datetime.
 
-    Tries ``published_parsed`` (UTC ``time.struct_time`` from feedparser)
-    first, then parses the raw ``published`` RFC-2822 string, then falls
-    back to *now*.
+    Memoised because the same timestamps reappear on every poll.
+
+    Raises:
+        ValueError: If *raw* is not a valid ISO 8601 timestamp.
     """
-    raw_time = item.get("published_parsed")
-    if raw_time is not None:
-        return datetime(*raw_time[:6], tzinfo=timezone.utc)
+    dt = datetime.fromisoformat(raw)
+    # fastfeedparser emits "+00:00" offsets, which parse straight to
+    # the timezone.utc singleton — no conversion needed.
+    if dt.tzinfo is timezone.utc:
+        return dt
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
 
-    raw_str: str = item.get("published", "")
+def _parse_pubdate(item: feedparser.FastFeedParserDict) -> Optional[datetime]:
+    """
+    Return a timezone-aware UTC datetime for a feed item.
+
+    Parses the ISO 8601 ``published`` string fastfeedparser normalises
+    every feed date to, then falls back to ``updated``. Returns ``None``
+    if neither parses.
+    """
+    raw_str: str = item.get("published") or item.get("updated") or ""
     if raw_str:
         try:
-            return parsedate_to_datetime(raw_str).astimezone(timezone.utc)
-        except Exception:
+            return _parse_iso_utc(raw_str)
+        except ValueError:
             pass
 
-    logger.warning("Could not parse pubDate for OpenAI News item; using current time.")
-    return datetime.now(tz=timezone.utc)
+    return None
 
 
-# ---------------------------------------------------------------------------
-# Public API
-# ---------------------------------------------------------------------------
-
-def fetch_openai_news(since: Optional[datetime] = None) -> list[OpenAINewsEntry]:
+def _build_entries(feed_entries: list, since: Optional[datetime]) -> list[OpenAINewsEntry]:
     """
-    Fetch recent posts from the OpenAI News RSS feed.
+    Convert parsed feed items into :class:`OpenAINewsEntry` objects.
 
-    The feed is assumed to be sorted **newest first**. Iteration stops as
-    soon as an entry older than *since* is encountered, so only the head of
-    the feed is ever processed.
-
-    Args:
-        since: Only return entries published *after* this UTC datetime.
-               Pass ``None`` to return all entries in the feed.
-
-    Returns:
-        A list of :class:`OpenAINewsEntry` objects, ordered newest-first.
-        Returns an empty list if the feed is unavailable or empty.
+    The feed is assumed to be sorted **newest first**, so only the items
+    before the first one published at or before *since* are converted.
     """
-    try:
-        feed = feedparser.parse(_FEED_URL)
-    except Exception as exc:
-        logger.error("Unexpected error parsing OpenAI News RSS feed: %s", exc)
-        return []
-
-    if not feed.entries:
+    if not feed_entries:
         logger.warning("OpenAI News RSS feed is empty or could not be fetched.")
         return []
 
+    # Happy path inlined: attribute access skips the dict-style .get()
+    # lookups; _parse_pubdate only handles missing or malformed dates.
+    pub_times: list[Optional[datetime]] = []
+    for item in feed_entries:
+        try:
+            pub_times.append(_parse_iso_utc(item.published))
+        except (AttributeError, TypeError, ValueError):
+            pub_times.append(_parse_pubdate(item))
+
+    # RSS is newest-first, so the entries newer than *since* form a prefix
+    # of the feed; binary-search for where it ends. Undated items count as
+    # new, which breaks the ordering bisect relies on, so fall back to a
+    # linear scan for the first dated item at or before *since*.
+    if since is None:
+        cutoff = len(pub_times)
+    elif None not in pub_times:
+        cutoff = bisect_left(pub_times, True, key=lambda dt: dt <= since)
+    else:
+        cutoff = next(
+            (i for i, dt in enumerate(pub_times) if dt is not None and dt <= since),
+            len(pub_times),
+        )
+
     entries: list[OpenAINewsEntry] = []
 
-    for item in feed.entries:
+    for item, published_at in zip(feed_entries[:cutoff], pub_times):
         url: str = item.get("link", "")
         title: str = item.get("title", "Untitled").strip()
-        published_at: datetime = _parse_pubdate(item)
 
-        # Stop early — RSS is newest-first, so everything from here is older.
-        if since is not None and published_at <= since:
-            break
+        if published_at is None:
+            logger.warning("Could not parse pubDate for OpenAI News item; using current time.")
+            published_at = datetime.now(tz=timezone.utc)
 
-        raw_content: str = item.get("summary", "") or ""
+        raw_content: str = item.get("description") or item.get("summary") or ""
         content: Optional[str] = _strip_html(raw_content) if raw_content else None
 
         entries.append(
@@ -136,6 +169,55 @@ def fetch_openai_news(since: Optional[datetime] = None) -> list[OpenAINewsEntry]
     logger.info("Fetched %d OpenAI News entry/entries.", len(entries))
     return entries
 
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def fetch_openai_news(since: Optional[datetime] = None) -> list[OpenAINewsEntry]:
+    """
+    Fetch recent posts from the OpenAI News RSS feed.
+
+    The feed is assumed to be sorted **newest first**. The first entry
+    older than *since* is located by binary search (or a linear scan if
+    some entries are undated), so only the head of the feed is converted.
+
+    Args:
+        since: Only return entries published *after* this UTC datetime.
+               Pass ``None`` to return all entries in the feed.
+
+    Returns:
+        A list of :class:`OpenAINewsEntry` objects, ordered newest-first.
+        Returns an empty list if the feed is unavailable or empty.
+    """
+    try:
+        feed_entries = fetch_feed_entries(_FEED_URL)
+    except Exception as exc:
+        logger.error("Unexpected error parsing OpenAI News RSS feed: %s", exc)
+        return []
+
+    return _build_entries(feed_entries, since)
+
+
+async def fetch_openai_news_async(
+    client: httpx.AsyncClient,
+    since: Optional[datetime] = None,
+) -> list[OpenAINewsEntry]:
+    """
+    Async variant of :func:`fetch_openai_news`.
+
+    Downloads the feed with the caller's *client* so it can run alongside
+    the other fetchers in a single event loop.
+    """
+    try:
+        feed_entries = await fetch_feed_entries_async(_FEED_URL, client)
+    except Exception as exc:
+        logger.error("Unexpected error parsing OpenAI News RSS feed: %s", exc)
+        return []
+
+    # HTML stripping is CPU work; keep it off the event loop.
+    return await asyncio.to_thread(_build_entries, feed_entries, since)
+
 if __name__ == "__main__":
     entries = fetch_openai_news(since=datetime.now(timezone.utc) - timedelta(days=1))
     if entries:
@@ -15,26 +15,49 @@ Usage::
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
 import re
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from pathlib import Path
 from typing import Optional
 
-import feedparser
-from bs4 import BeautifulSoup
-from pydantic import BaseModel
+import diskcache
+import fastfeedparser as feedparser
+import httpx
+from bs4 import BeautifulSoup, SoupStrainer
+from selectolax.lexbor import LexborHTMLParser
+
+from aggregator.fetchers.feed_cache import fetch_feed_entries, fetch_feed_entries_async
 
 logger = logging.getLogger(__name__)
 
+# Whitespace normalisers used by _strip_html, compiled once at import.
+_WS_RE = re.compile(r"[ \t]+")
+_NL_RE = re.compile(r"\n{3,}")
+
+# Tags that carry digest text; the BeautifulSoup fallback builds only these.
+_TEXT_STRAINER = SoupStrainer(
+    ["p", "h1", "h2", "h3", "h4", "h5", "h6", "li", "a", "span",
+     "td", "th", "div", "pre", "code", "blockquote"]
+)
+
 _FEED_URL = "https://news.smol.ai/rss.xml"
 
+# Cleaned digest text, keyed by issue GUID.
+_CONTENT_CACHE_DIR = Path.home() / ".cache" / "ai-news" / "smol"
+_CONTENT_CACHE_TTL = 12 * 60 * 60  # seconds
+
 
 # ---------------------------------------------------------------------------
 # Data model
 # ---------------------------------------------------------------------------
 
-class SmolAIEntry(BaseModel):
+@dataclass(slots=True)
+class SmolAIEntry:
     """A single daily issue from the Smol AI news digest."""
 
     post_id: str          # The issue URL used as a stable identifier.
@@ -52,38 +75,99 @@ def _strip_html(raw: str) -> str:
     """
     Remove HTML tags from *raw* and return normalised plain text.
 
-    Uses BeautifulSoup to handle malformed markup gracefully, then
-    collapses runs of whitespace so the result is LLM-friendly.
+    Extracts text with selectolax's native lexbor parser, dropping
+    ``<script>`` / ``<style>`` content. If selectolax fails, falls back to
+    BeautifulSoup, which handles malformed markup gracefully and only
+    builds nodes for text-bearing tags. Either way, runs of whitespace are
+    then collapsed so the result is LLM-friendly. Input with no markup or
+    entities skips parsing altogether.
     """
-    text = BeautifulSoup(raw, "html.parser").get_text(separator=" ")
+    if "<" not in raw and "&" not in raw:
+        # Plain text: nothing to parse.
+        text = raw
+    else:
+        try:
+            tree = LexborHTMLParser(raw)
+            tree.strip_tags(["script", "style", "noscript"])
+            root = tree.body or tree.root
+            text = root.text(separator=" ") if root is not None else ""
+        except Exception as exc:
+            logger.debug("selectolax failed on Smol AI content, falling back to BeautifulSoup: %s", exc)
+            text = BeautifulSoup(raw, "lxml", parse_only=_TEXT_STRAINER).get_text(separator=" ")
+
     # Collapse multiple spaces / newlines into a single space.
-    text = re.sub(r"[ \t]+", " ", text)
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = _WS_RE.sub(" ", text)
+    text = _NL_RE.sub("\n\n", text)
     return text.strip()
 
 
+@lru_cache(maxsize=1)
+def _content_cache() -> diskcache.Cache:
+    """Return the on-disk cache of cleaned digest text (created on first use)."""
+    return diskcache.Cache(str(_CONTENT_CACHE_DIR))
+
+
+def _clean_content(cache_key: str, raw: str) -> str:
+    """
+    Return ``_strip_html(raw)``, cached on disk by the issue's GUID.
+
+    The digest body for a given issue does not change, so repeat runs
+    within :data:`_CONTENT_CACHE_TTL` skip HTML parsing entirely.
+    """
+    key = hashlib.sha256(cache_key.encode()).hexdigest()
+    try:
+        cached = _content_cache().get(key)
+    except Exception as exc:
+        logger.warning("Could not read Smol AI content cache: %s", exc)
+        cached = None
+    if cached is not None:
+        logger.debug("Using cached Smol AI content for '%s'", cache_key)
+        return cached
+
+    text = _strip_html(raw)
+    try:
+        _content_cache().set(key, text, expire=_CONTENT_CACHE_TTL)
+    except Exception as exc:
+        logger.warning("Could not write Smol AI content cache: %s", exc)
+    return text
+
+
 # ---------------------------------------------------------------------------
 # Date parsing
 # ---------------------------------------------------------------------------
 
-def _parse_pubdate(item: feedparser.FeedParserDict) -> datetime:
+@lru_cache(maxsize=2048)
+def _parse_iso_utc(raw: str) -> datetime:
     """
-    Return a timezone-aware UTC datetime for the feed item.
+    Parse an ISO 8601 timestamp into a timezone-aware UTC datetime.
 
-    Tries ``published_parsed`` (a ``time.struct_time`` in UTC produced by
-    feedparser) first, then falls back to parsing the raw ``published``
-    string, then falls back to *now*.
+    Memoised because the same timestamps reappear on every poll.
+
+    Raises:
+        ValueError: If *raw* is not a valid ISO 8601 timestamp.
     """
-    raw_time = item.get("published_parsed")
-    if raw_time is not None:
-        return datetime(*raw_time[:6], tzinfo=timezone.utc)
+    dt = datetime.fromisoformat(raw)
+    # fastfeedparser emits "+00:00" offsets, which parse straight to
+    # the timezone.utc singleton — no conversion needed.
+    if dt.tzinfo is timezone.utc:
+        return dt
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+def _parse_pubdate(item: feedparser.FastFeedParserDict) -> datetime:
+    """
+    Return a timezone-aware UTC datetime for the feed item.
 
-    raw_str: str = item.get("published", "")
+    fastfeedparser normalises feed dates to ISO 8601 strings, so this
+    parses ``published`` (or ``updated``) directly and falls back to *now*.
+    """
+    raw_str: str = item.get("published") or item.get("updated") or ""
     if raw_str:
         try:
-            dt = parsedate_to_datetime(raw_str)
-            return dt.astimezone(timezone.utc)
-        except Exception:
+            return _parse_iso_utc(raw_str)
+        except ValueError:
             pass
 
     logger.warning("Could not parse pubDate for Smol AI item; using current time.")
@@ -91,47 +175,39 @@ def _parse_pubdate(item: feedparser.FeedParserDict) -> datetime:
 
 
 # ---------------------------------------------------------------------------
-# Public API
+# Entry construction
 # ---------------------------------------------------------------------------
 
-def fetch_latest_smol_ai_issue() -> list[SmolAIEntry]:
-    """
-    Fetch the most recent daily digest from Smol AI.
-
-    Parses the RSS feed and reads **only the first item** (the latest issue).
-
-    Returns:
-        A list containing one :class:`SmolAIEntry`, or an empty list if the
-        feed is unavailable or contains no items.
-    """
-    try:
-        feed = feedparser.parse(_FEED_URL)
-    except Exception as exc:
-        logger.error("Unexpected error parsing Smol AI RSS feed: %s", exc)
-        return []
-
-    if not feed.entries:
+def _build_entry(feed_entries: list) -> list[SmolAIEntry]:
+    """Convert the first (most recent) parsed feed item into a :class:`SmolAIEntry`."""
+    if not feed_entries:
         logger.warning("Smol AI RSS feed is empty or could not be fetched.")
         return []
 
     # Only process the first (most recent) item.
-    item = feed.entries[0]
+    item = feed_entries[0]
 
     url: str = item.get("link", "")
     title: str = item.get("title", "Untitled")
-    published_at: datetime = _parse_pubdate(item)
+    # Happy path inlined; _parse_pubdate only handles missing or malformed dates.
+    try:
+        published_at: datetime = _parse_iso_utc(item.published)
+    except (AttributeError, TypeError, ValueError):
+        published_at = _parse_pubdate(item)
 
     # Content priority: content:encoded → description → None.
     raw_content: str = ""
     content_list = item.get("content", [])
     if content_list:
-        # feedparser surfaces <content:encoded> as entries[n].content[0].value
-        raw_content = content_list[0].get("value", "")
+        # fastfeedparser surfaces <content:encoded> as entries[n].content[0].value
+        raw_content = content_list[0].get("value", "") or ""
 
     if not raw_content:
-        raw_content = item.get("summary", "") or ""
+        raw_content = item.get("description") or item.get("summary") or ""
 
-    content: Optional[str] = _strip_html(raw_content) if raw_content else None
+    content: Optional[str] = (
+        _clean_content(item.get("id") or url, raw_content) if raw_content else None
+    )
 
     entry = SmolAIEntry(
         post_id=url,
@@ -150,6 +226,46 @@ def fetch_latest_smol_ai_issue() -> list[SmolAIEntry]:
 
     return [entry]
 
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def fetch_latest_smol_ai_issue() -> list[SmolAIEntry]:
+    """
+    Fetch the most recent daily digest from Smol AI.
+
+    Parses the RSS feed and reads **only the first item** (the latest issue).
+
+    Returns:
+        A list containing one :class:`SmolAIEntry`, or an empty list if the
+        feed is unavailable or contains no items.
+    """
+    try:
+        feed_entries = fetch_feed_entries(_FEED_URL)
+    except Exception as exc:
+        logger.error("Unexpected error parsing Smol AI RSS feed: %s", exc)
+        return []
+
+    return _build_entry(feed_entries)
+
+
+async def fetch_latest_smol_ai_issue_async(client: httpx.AsyncClient) -> list[SmolAIEntry]:
+    """
+    Async variant of :func:`fetch_latest_smol_ai_issue`.
+
+    Downloads the feed with the caller's *client* so it can run alongside
+    the other fetchers in a single event loop.
+    """
+    try:
+        feed_entries = await fetch_feed_entries_async(_FEED_URL, client)
+    except Exception as exc:
+        logger.error("Unexpected error parsing Smol AI RSS feed: %s", exc)
+        return []
+
+    # Cleaning the digest HTML is CPU work; keep it off the event loop.
+    return await asyncio.to_thread(_build_entry, feed_entries)
+
 if __name__ == "__main__":
     entries = fetch_latest_smol_ai_issue()
     if entries and entries[0].content:
@@ -14,14 +14,20 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
+from pathlib import Path
 from typing import Optional
 
-import feedparser
 import httpx
+import lxml.html
 from youtube_transcript_api import YouTubeTranscriptApi
 from youtube_transcript_api import (
     NoTranscriptFound,
@@ -29,6 +35,9 @@ from youtube_transcript_api import (
     VideoUnavailable,
 )
 
+from aggregator.fetchers.feed_cache import fetch_feed_entries, fetch_feed_entries_async
+from aggregator.fetchers.http_client import CLIENT
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -60,9 +69,76 @@ class VideoEntry:
 
 # A YouTube channel ID always starts with "UC" and is 24 characters total.
 _CHANNEL_ID_RE = re.compile(r"^UC[\w-]{22}$")
+_CHANNEL_URL_RE = re.compile(r"youtube\.com/channel/(UC[\w-]{22})")
 
 _RSS_URL = "https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}"
-_HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; AINewsAggregator/1.0)"}
+
+# Handle → channel ID mappings practically never change, so scraped IDs are
+# persisted across runs and only re-scraped after the TTL expires.
+_CHANNEL_CACHE_PATH = Path.home() / ".cache" / "ai-news" / "channels.json"
+_CHANNEL_CACHE_TTL = 7 * 24 * 60 * 60  # seconds
+_CHANNEL_CACHE_LOCK = threading.Lock()
+
+# In-process copy of the disk cache, so repeat lookups in a long-running
+# process skip the file read. Entries obey the same TTL.
+_CHANNEL_MEMO: dict[str, tuple[str, float]] = {}
+
+
+def _load_channel_cache() -> dict[str, list]:
+    """Return the ``{input: [channel_id, resolved_at_epoch]}`` map on disk."""
+    try:
+        cache = json.loads(_CHANNEL_CACHE_PATH.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as exc:
+        logger.warning("Ignoring unreadable channel cache '%s': %s", _CHANNEL_CACHE_PATH, exc)
+        return {}
+    if not isinstance(cache, dict):
+        logger.warning("Ignoring malformed channel cache '%s'", _CHANNEL_CACHE_PATH)
+        return {}
+    return cache
+
+
+def _get_cached_channel_id(channel_input: str) -> Optional[str]:
+    """Return a cached channel ID younger than the TTL, or ``None``."""
+    now = time.time()
+
+    memo = _CHANNEL_MEMO.get(channel_input)
+    if memo is not None and now - memo[1] < _CHANNEL_CACHE_TTL:
+        return memo[0]
+
+    with _CHANNEL_CACHE_LOCK:
+        cached = _load_channel_cache().get(channel_input)
+
+    # Expect [channel_id, resolved_at_epoch]; ignore anything else.
+    if not (
+        isinstance(cached, list)
+        and len(cached) == 2
+        and isinstance(cached[0], str)
+        and _CHANNEL_ID_RE.match(cached[0])
+        and isinstance(cached[1], (int, float))
+    ):
+        return None
+
+    channel_id, resolved_at = cached
+    if now - resolved_at >= _CHANNEL_CACHE_TTL:
+        return None
+
+    _CHANNEL_MEMO[channel_input] = (channel_id, resolved_at)
+    return channel_id
+
+
+def _store_channel_id(channel_input: str, channel_id: str) -> None:
+    resolved_at = time.time()
+    _CHANNEL_MEMO[channel_input] = (channel_id, resolved_at)
+    with _CHANNEL_CACHE_LOCK:
+        cache = _load_channel_cache()
+        cache[channel_input] = [channel_id, resolved_at]
+        try:
+            _CHANNEL_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            _CHANNEL_CACHE_PATH.write_text(json.dumps(cache, indent=2), encoding="utf-8")
+        except OSError as exc:
+            logger.warning("Could not write channel cache '%s': %s", _CHANNEL_CACHE_PATH, exc)
 
 
 def resolve_channel_id(channel_input: str) -> str:
@@ -70,6 +146,9 @@ def resolve_channel_id(channel_input: str) -> str:
     Accept a channel ID (UCxxx...), a legacy username, or a handle (@name)
     and return a normalised 24-character channel ID.
 
+    Resolved handles are cached in memory and on disk for 7 days, so the
+    channel page is only scraped on a miss or once the entry has expired.
+
     Raises:
         ValueError: If the input cannot be resolved to a valid channel ID.
     """
@@ -85,7 +164,13 @@ def resolve_channel_id(channel_input: str) -> str:
     else:
         url = f"https://www.youtube.com/@{channel_input}"
 
-    return _scrape_channel_id(url)
+    cached_id = _get_cached_channel_id(channel_input)
+    if cached_id:
+        return cached_id
+
+    channel_id = _scrape_channel_id(url)
+    _store_channel_id(channel_input, channel_id)
+    return channel_id
 
 
 def _scrape_channel_id(page_url: str) -> str:
@@ -99,12 +184,7 @@ def _scrape_channel_id(page_url: str) -> str:
         ValueError: If the page cannot be fetched or the ID cannot be found.
     """
     try:
-        response = httpx.get(
-            page_url,
-            follow_redirects=True,
-            headers=_HEADERS,
-            timeout=10,
-        )
+        response = CLIENT.get(page_url)
         response.raise_for_status()
     except httpx.HTTPStatusError as exc:
         raise ValueError(
@@ -115,7 +195,16 @@ def _scrape_channel_id(page_url: str) -> str:
             f"Network error while fetching channel page '{page_url}': {exc}"
         ) from exc
 
-    match = re.search(r"youtube\.com/channel/(UC[\w-]{22})", response.text)
+    # Read the ID from the canonical <link> href rather than regex-scanning
+    # the whole (several hundred KB) page.
+    canonical = lxml.html.fromstring(response.content).find('.//link[@rel="canonical"]')
+    if canonical is not None:
+        channel_id = (canonical.get("href") or "").rstrip("/").rpartition("/")[2]
+        if _CHANNEL_ID_RE.match(channel_id):
+            return channel_id
+
+    # Fall back to scanning the page in case the canonical tag is missing.
+    match = _CHANNEL_URL_RE.search(response.text)
     if match:
         return match.group(1)
 
@@ -129,64 +218,48 @@ def _scrape_channel_id(page_url: str) -> str:
 # RSS feed — video listing
 # ---------------------------------------------------------------------------
 
-def fetch_videos(
+def _build_video_entries(
     channel_id: str,
-    since: Optional[datetime] = None,
-    max_results: int = 50,
+    feed_entries: list,
+    since: Optional[datetime],
+    max_results: int,
 ) -> list[VideoEntry]:
     """
-    Fetch recent videos from a channel's public RSS feed.
-
-    Args:
-        channel_id: A resolved YouTube channel ID (UCxxx...).
-        since:      Only return videos published *after* this UTC datetime.
-                    Pass ``None`` to return all entries in the feed (≤ 15).
-        max_results: Hard cap on the number of returned videos.
-
-    Returns:
-        A list of :class:`VideoEntry` objects, sorted newest-first.
+    Convert parsed feed items into :class:`VideoEntry` objects.
 
     Raises:
-        RuntimeError: If the feed cannot be parsed or returns no entries.
+        RuntimeError: If the feed returned no entries.
     """
-    rss_url = _RSS_URL.format(channel_id=channel_id)
-
-    try:
-        feed = feedparser.parse(rss_url)
-    except Exception as exc:
-        raise RuntimeError(
-            f"Unexpected error parsing RSS feed for '{channel_id}': {exc}"
-        ) from exc
-
-    if feed.bozo and not feed.entries:
+    if not feed_entries:
         raise RuntimeError(
-            f"RSS feed for channel '{channel_id}' is malformed or empty. "
-            f"bozo_exception: {feed.get('bozo_exception')}"
+            f"RSS feed for channel '{channel_id}' is malformed or empty."
         )
 
     entries: list[VideoEntry] = []
 
-    for item in feed.entries[:max_results]:
-        video_id: str = item.get("yt_videoid", "")
+    for item in feed_entries[:max_results]:
+        # The Atom <id> is "yt:video:<video_id>".
+        video_id: str = item.get("yt_videoid") or (item.get("id") or "").rpartition(":")[2]
         title: str = item.get("title", "Untitled")
-        url: str = item.get("link", f"https://www.youtube.com/watch?v={video_id}")
-
-        # feedparser returns a time.struct_time in UTC via `published_parsed`.
-        raw_time = item.get("published_parsed")
-        published_at = (
-            datetime(*raw_time[:6], tzinfo=timezone.utc)
-            if raw_time
-            else datetime.now(tz=timezone.utc)
-        )
+        url: str = item.get("link") or f"https://www.youtube.com/watch?v={video_id}"
+
+        # fastfeedparser normalises dates to ISO 8601 strings in UTC.
+        try:
+            published_at = datetime.fromisoformat(item.published).astimezone(timezone.utc)
+        except (AttributeError, TypeError, ValueError):
+            published_at = datetime.now(tz=timezone.utc)
 
         # Apply time-window filter.
         if since is not None and published_at <= since:
             continue
 
         # Description: prefer media:group summary, fall back to entry summary.
+        # fastfeedparser attaches <media:description> to the media:content item.
+        media_content = item.get("media_content") or [{}]
         raw_description = (
-            item.get("media_description")
-            or item.get("summary", "")
+            media_content[0].get("description")
+            or item.get("description")
+            or item.get("summary")
             or ""
         )
         description = raw_description.strip() or None
@@ -204,11 +277,70 @@ def fetch_videos(
     return entries
 
 
+def fetch_videos(
+    channel_id: str,
+    since: Optional[datetime] = None,
+    max_results: int = 50,
+) -> list[VideoEntry]:
+    """
+    Fetch recent videos from a channel's public RSS feed.
+
+    Args:
+        channel_id: A resolved YouTube channel ID (UCxxx...).
+        since:      Only return videos published *after* this UTC datetime.
+                    Pass ``None`` to return all entries in the feed (≤ 15).
+        max_results: Hard cap on the number of returned videos.
+
+    Returns:
+        A list of :class:`VideoEntry` objects, sorted newest-first.
+
+    Raises:
+        RuntimeError: If the feed cannot be parsed or returns no entries.
+    """
+    rss_url = _RSS_URL.format(channel_id=channel_id)
+
+    try:
+        feed_entries = fetch_feed_entries(rss_url)
+    except Exception as exc:
+        raise RuntimeError(
+            f"Unexpected error parsing RSS feed for '{channel_id}': {exc}"
+        ) from exc
+
+    return _build_video_entries(channel_id, feed_entries, since, max_results)
+
+
+async def fetch_videos_async(
+    channel_id: str,
+    client: httpx.AsyncClient,
+    since: Optional[datetime] = None,
+    max_results: int = 50,
+) -> list[VideoEntry]:
+    """
+    Async variant of :func:`fetch_videos` using the caller's *client*.
+
+    Raises:
+        RuntimeError: If the feed cannot be parsed or returns no entries.
+    """
+    rss_url = _RSS_URL.format(channel_id=channel_id)
+
+    try:
+        feed_entries = await fetch_feed_entries_async(rss_url, client)
+    except Exception as exc:
+        raise RuntimeError(
+            f"Unexpected error parsing RSS feed for '{channel_id}': {exc}"
+        ) from exc
+
+    return _build_video_entries(channel_id, feed_entries, since, max_results)
+
+
 # ---------------------------------------------------------------------------
 # Transcript retrieval
 # ---------------------------------------------------------------------------
 
-def get_transcript(video_id: str) -> Optional[Transcript]:
+def get_transcript(
+    video_id: str,
+    ytt_api: Optional[YouTubeTranscriptApi] = None,
+) -> Optional[Transcript]:
     """
     Retrieve the transcript for a YouTube video as a clean English plain-text string.
 
@@ -217,11 +349,16 @@ def get_transcript(video_id: str) -> Optional[Transcript]:
 
     Args:
         video_id: The 11-character YouTube video ID.
+        ytt_api:  API instance to reuse, so its HTTP session (and connection
+                  pool) is shared across videos. Instances are not
+                  thread-safe; use one per thread. A new one is created if
+                  omitted.
 
     Returns:
         A :class:`Transcript` wrapping the full English plain-text, or ``None``.
     """
-    ytt_api = YouTubeTranscriptApi()
+    if ytt_api is None:
+        ytt_api = YouTubeTranscriptApi()
 
     try:
         snippets = ytt_api.fetch(video_id, languages=["en"])
@@ -240,19 +377,57 @@ def get_transcript(video_id: str) -> Optional[Transcript]:
 
     # Assemble a clean plain-text string from snippet objects.
     # FetchedTranscriptSnippet exposes .text as an attribute in v1.x.
-    parts: list[str] = []
-    for snippet in snippets:
-        text = getattr(snippet, "text", None) or ""
-        text = text.strip()
-        if text:
-            parts.append(text)
+    # Stream the stripped texts straight into join; no intermediate list.
+    strip = str.strip
+    text = " ".join(
+        part
+        for part in (strip(getattr(snippet, "text", None) or "") for snippet in snippets)
+        if part
+    )
 
-    return Transcript(text=" ".join(parts)) if parts else None
+    return Transcript(text=text) if text else None
 
 # ---------------------------------------------------------------------------
 # High-level public API
 # ---------------------------------------------------------------------------
 
+# Maximum number of transcripts fetched concurrently per channel.
+_TRANSCRIPT_WORKERS = 8
+
+# YouTubeTranscriptApi is not thread-safe (it mutates its session's cookie
+# jar), so each transcript worker thread gets its own instance.
+_THREAD_STATE = threading.local()
+
+
+def _get_transcript_in_thread(video_id: str) -> Optional[Transcript]:
+    """Call :func:`get_transcript` with this thread's API instance."""
+    ytt_api = getattr(_THREAD_STATE, "ytt_api", None)
+    if ytt_api is None:
+        ytt_api = _THREAD_STATE.ytt_api = YouTubeTranscriptApi()
+    return get_transcript(video_id, ytt_api=ytt_api)
+
+
+def _attach_transcripts(videos: list[VideoEntry]) -> None:
+    """Fetch and set ``transcript`` on every video in *videos*."""
+    if not videos:
+        return
+
+    # Each transcript is an independent blocking HTTP round-trip, so
+    # fetch them concurrently rather than one video at a time. Every worker
+    # reuses its own API instance (and connection pool) across videos.
+    with ThreadPoolExecutor(max_workers=min(_TRANSCRIPT_WORKERS, len(videos))) as executor:
+        transcripts = executor.map(_get_transcript_in_thread, [v.video_id for v in videos])
+
+    for video, transcript in zip(videos, transcripts):
+        video.transcript = transcript
+        if video.transcript:
+            logger.debug(
+                "Transcript: %s", video.video_id
+            )
+        else:
+            logger.debug("No transcript: %s", video.video_id)
+
+
 def fetch_channel_videos(
     channel_input: str,
     since: Optional[datetime] = None,
@@ -283,16 +458,32 @@ def fetch_channel_videos(
     logger.info("Found %d video(s) in channel %s", len(videos), channel_id)
 
     if include_transcripts:
-        for video in videos:
-            video.transcript = get_transcript(
-                video.video_id
-            )
-            if video.transcript:
-                logger.debug(
-                    "Transcript: %s", video.video_id
-                )
-            else:
-                logger.debug("No transcript: %s", video.video_id)
+        _attach_transcripts(videos)
+
+    return videos
+
+
+async def fetch_channel_videos_async(
+    channel_input: str,
+    client: httpx.AsyncClient,
+    since: Optional[datetime] = None,
+    include_transcripts: bool = True,
+    max_results: int = 50,
+) -> list[VideoEntry]:
+    """
+    Async variant of :func:`fetch_channel_videos`.
+
+    The feed is downloaded with the caller's *client*; channel resolution
+    and transcript retrieval are blocking, so they run in worker threads.
+    """
+    channel_id = await asyncio.to_thread(resolve_channel_id, channel_input)
+    logger.info("Resolved '%s' → channel_id=%s", channel_input, channel_id)
+
+    videos = await fetch_videos_async(channel_id, client, since=since, max_results=max_results)
+    logger.info("Found %d video(s) in channel %s", len(videos), channel_id)
+
+    if include_transcripts:
+        await asyncio.to_thread(_attach_transcripts, videos)
 
     return videos
 
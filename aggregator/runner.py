@@ -10,6 +10,9 @@ Usage::
 
     entries = run_all_fetchers(hours=24)
 
+    # or, inside a coroutine:
+    entries = await run_all_fetchers_async(hours=24)
+
 Or from the command line::
 
     python -m aggregator.runner
@@ -17,7 +20,9 @@ Or from the command line::
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
@@ -26,9 +31,10 @@ from aggregator.config.sources import (
     RSS_SOURCES,
     YOUTUBE_CHANNELS,
 )
-from aggregator.fetchers.openai_news import fetch_openai_news
-from aggregator.fetchers.smol_ai import fetch_latest_smol_ai_issue
-from aggregator.fetchers.youtube import fetch_channel_videos
+from aggregator.fetchers.http_client import new_async_client
+from aggregator.fetchers.openai_news import fetch_openai_news_async
+from aggregator.fetchers.smol_ai import fetch_latest_smol_ai_issue_async
+from aggregator.fetchers.youtube import fetch_channel_videos_async
 
 logger = logging.getLogger(__name__)
 
@@ -40,11 +46,11 @@ logger = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 
 _RSS_FETCHERS: dict[str, Any] = {
-    "openai_news": fetch_openai_news,
+    "openai_news": fetch_openai_news_async,
 }
 
 _NEWSLETTER_FETCHERS: dict[str, Any] = {
-    "smol_ai": fetch_latest_smol_ai_issue,
+    "smol_ai": fetch_latest_smol_ai_issue_async,
 }
 
 
@@ -52,76 +58,97 @@ _NEWSLETTER_FETCHERS: dict[str, Any] = {
 # Public API
 # ---------------------------------------------------------------------------
 
-def run_all_fetchers(hours: int = 24) -> list[Any]:
+async def run_all_fetchers_async(hours: int = 24) -> list[Any]:
     """
-    Execute all configured fetchers and return a unified entry list.
+    Execute all configured fetchers concurrently and return a unified entry list.
 
     Each fetcher receives the cutoff datetime so filtering happens
     inside the fetcher — no bulk fetching followed by post-hoc trimming.
+    All feed downloads share one HTTP/2 :class:`httpx.AsyncClient` and are
+    overlapped with :func:`asyncio.gather`, so total wall time is roughly
+    that of the slowest source rather than the sum of all.
 
     Args:
         hours: Look-back window in hours. Only entries published within
                this window are included. Defaults to 24 hours.
 
     Returns:
-        Combined list of all fetched entries (mixed Pydantic model types).
+        Combined list of all fetched entries (mixed dataclass types).
     """
     cutoff = datetime.now(tz=timezone.utc) - timedelta(hours=hours)
     logger.info("Running all fetchers with cutoff=%s (last %d hours)", cutoff.isoformat(), hours)
 
-    all_entries: list[Any] = []
+    async with new_async_client() as client:
+        labels: list[tuple[str, str]] = []
+        coros: list[Any] = []
 
-    # --- YouTube ---
-    for channel in YOUTUBE_CHANNELS:
-        logger.info("Fetching YouTube channel: %s", channel)
-        try:
-            videos = fetch_channel_videos(channel, since=cutoff)
-            logger.info("  → %d video(s) from '%s'", len(videos), channel)
-            all_entries.extend(videos)
-        except Exception as exc:
-            logger.error("YouTube fetch failed for '%s': %s", channel, exc)
-
-    # --- RSS sources ---
-    for source in RSS_SOURCES:
-        name = source["name"]
-        fetcher_key = source["fetcher"]
-        fetcher_fn = _RSS_FETCHERS.get(fetcher_key)
-
-        if fetcher_fn is None:
-            logger.warning("No RSS fetcher registered for key '%s' (source: %s)", fetcher_key, name)
-            continue
+        # --- YouTube ---
+        for channel in YOUTUBE_CHANNELS:
+            labels.append(("YouTube", channel))
+            coros.append(fetch_channel_videos_async(channel, client, since=cutoff))
 
-        logger.info("Fetching RSS source: %s", name)
-        try:
-            entries = fetcher_fn(since=cutoff)
-            logger.info("  → %d entry/entries from '%s'", len(entries), name)
-            all_entries.extend(entries)
-        except Exception as exc:
-            logger.error("RSS fetch failed for '%s': %s", name, exc)
-
-    # --- Newsletter / digest sources ---
-    for source in NEWSLETTER_SOURCES:
-        name = source["name"]
-        fetcher_key = source["fetcher"]
-        fetcher_fn = _NEWSLETTER_FETCHERS.get(fetcher_key)
-
-        if fetcher_fn is None:
-            logger.warning("No newsletter fetcher registered for key '%s' (source: %s)", fetcher_key, name)
-            continue
+        # --- RSS sources ---
+        for source in RSS_SOURCES:
+            name = source["name"]
+            fetcher_key = source["fetcher"]
+            fetcher_fn = _RSS_FETCHERS.get(fetcher_key)
+
+            if fetcher_fn is None:
+                logger.warning("No RSS fetcher registered for key '%s' (source: %s)", fetcher_key, name)
+                continue
+
+            labels.append(("RSS", name))
+            coros.append(fetcher_fn(client, since=cutoff))
+
+        # --- Newsletter / digest sources ---
+        for source in NEWSLETTER_SOURCES:
+            name = source["name"]
+            fetcher_key = source["fetcher"]
+            fetcher_fn = _NEWSLETTER_FETCHERS.get(fetcher_key)
+
+            if fetcher_fn is None:
+                logger.warning("No newsletter fetcher registered for key '%s' (source: %s)", fetcher_key, name)
+                continue
 
-        logger.info("Fetching newsletter: %s", name)
-        try:
             # Newsletter fetchers always return the latest issue; no since= arg.
-            entries = fetcher_fn()
-            logger.info("  → %d entry/entries from '%s'", len(entries), name)
-            all_entries.extend(entries)
-        except Exception as exc:
-            logger.error("Newsletter fetch failed for '%s': %s", name, exc)
+            labels.append(("Newsletter", name))
+            coros.append(fetcher_fn(client))
+
+        for kind, label in labels:
+            logger.info("Fetching %s source: %s", kind, label)
+
+        results = await asyncio.gather(*coros, return_exceptions=True)
+
+    all_entries: list[Any] = []
+
+    for (kind, label), result in zip(labels, results):
+        if isinstance(result, BaseException):
+            logger.error("%s fetch failed for '%s': %s", kind, label, result)
+            continue
+        logger.info("  → %d entry/entries from '%s'", len(result), label)
+        all_entries.extend(result)
 
     logger.info("Total entries collected: %d", len(all_entries))
     return all_entries
 
 
+def run_all_fetchers(hours: int = 24) -> list[Any]:
+    """
+    Synchronous wrapper around :func:`run_all_fetchers_async`.
+
+    Safe to call whether or not an event loop is already running (e.g. in
+    a Jupyter kernel): in that case the fetchers run on a fresh loop in a
+    separate thread and this call blocks until they finish.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(run_all_fetchers_async(hours=hours))
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, run_all_fetchers_async(hours=hours)).result()
+
+
 # ---------------------------------------------------------------------------
 # CLI test block
 # ---------------------------------------------------------------------------